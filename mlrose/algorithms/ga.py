@@ -22,12 +22,14 @@ def _get_hamming_distance_float(population, p1):
 
 def _genetic_alg_select_parents(pop_size, problem,
                                 get_hamming_distance_func,
-                                hamming_factor=0.0):
-    mating_probabilities = problem.get_mate_probs()
+                                hamming_factor=0.0, mates=None):
+    if mates is None:
+        mates = problem.sample_mates(2)
+
+    population = problem.get_population()
     if get_hamming_distance_func is not None and hamming_factor > 0.01:
-        selected = np.random.choice(pop_size, p=mating_probabilities)
-        population = problem.get_population()
-        p1 = population[selected]
+        mating_probabilities = problem.get_mate_probs()
+        p1 = population[mates[0]]
         hamming_distances = get_hamming_distance_func(population, p1)
         hfa = hamming_factor / (1.0 - hamming_factor)
         hamming_distances = (hamming_distances * hfa) * mating_probabilities
@@ -37,11 +39,8 @@ def _genetic_alg_select_parents(pop_size, problem,
 
         return p1, p2
 
-    selected = np.random.choice(pop_size,
-                                size=2,
-                                p=mating_probabilities)
-    p1 = problem.get_population()[selected[0]]
-    p2 = problem.get_population()[selected[1]]
+    p1 = population[mates[0]]
+    p2 = population[mates[1]]
     return p1, p2
 
 
@@ -181,14 +180,18 @@ def genetic_alg(problem, pop_size=200, pop_breed_percent=0.75, elite_dreg_ratio=
         # Calculate breeding probabilities
         problem.eval_mate_probs()
 
+        # Draw the mates for the whole generation at once
+        mates = problem.sample_mates(2 * max(breeding_pop_size, 0)).reshape(-1, 2)
+
         # Create next generation of population
         next_gen = []
-        for _ in range(breeding_pop_size):
+        for i in range(breeding_pop_size):
             # Select parents
             parent_1, parent_2 = _genetic_alg_select_parents(pop_size=pop_size,
                                                              problem=problem,
                                                              hamming_factor=hamming_factor,
-                                                             get_hamming_distance_func=get_hamming_distance_func)
+                                                             get_hamming_distance_func=get_hamming_distance_func,
+                                                             mates=mates[i])
 
             # Create offspring
             child = problem.reproduce(parent_1, parent_2, mutation_prob)
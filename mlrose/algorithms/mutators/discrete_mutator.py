@@ -19,12 +19,11 @@ class DiscreteMutator(_MutatorBase):
         mutate = np.where(rand < mutation_probability)[0]
 
         if self._max_val == 2:
-            for i in mutate:
-                child[i] = np.abs(child[i] - 1)
+            child[mutate] = np.abs(child[mutate] - 1)
 
         else:
-            for i in mutate:
-                vals = list(np.arange(self._max_val))
-                vals.remove(child[i])
-                child[i] = vals[np.random.randint(0, self._max_val-1)]
+            # Shifting by 1 to max_val - 1 (mod max_val) picks uniformly
+            # among the values other than the current one
+            shift = np.random.randint(1, self._max_val, size=len(mutate))
+            child[mutate] = (child[mutate] + shift) % self._max_val
         return child
@@ -5,3 +5,4 @@
 # License: BSD 3 clause
 
 from .short_name_decorator import short_name, get_short_name
+from .jit_decorator import jit, has_jit
@@ -0,0 +1,22 @@
+""" Decorator to compile numerical kernels with numba, when it is installed.
+"""
+
+# License: BSD 3 clause
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def jit(func):
+    """Compile func to native code with :code:`numba.njit` if numba is
+    available; otherwise return func unchanged.
+    """
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
+
+def has_jit():
+    return numba is not None
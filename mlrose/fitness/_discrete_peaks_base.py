@@ -3,9 +3,52 @@
 # Author: Genevieve Hayes (Modified by Andrew Rollings)
 # License: BSD 3 clause
 
+import numpy as np
+
+from mlrose.decorators import jit, has_jit
+
+
+@jit
+def _head_jit(_b, _x):
+    _head = 0
+    for i in range(len(_x)):
+        if _x[i] != _b:
+            break
+        _head += 1
+    return _head
+
+
+@jit
+def _tail_jit(_b, _x):
+    _tail = 0
+    for i in range(len(_x) - 1, -1, -1):
+        if _x[i] != _b:
+            break
+        _tail += 1
+    return _tail
+
 
 class _DiscretePeaksBase:
 
+    def _get_threshold(self, _n):
+        """Return the threshold T for a state vector of length n.
+
+        The threshold is cached per t_pct and length, since the same length
+        is evaluated over and over during a search.
+        """
+        thresholds = getattr(self, '_thresholds', None)
+
+        if thresholds is None:
+            thresholds = self._thresholds = {}
+
+        _t = thresholds.get((self.t_pct, _n))
+
+        if _t is None:
+            _t = np.ceil(self.t_pct*_n)
+            thresholds[(self.t_pct, _n)] = _t
+
+        return _t
+
     @staticmethod
     def head(_b, _x):
         """Determine the number of leading b's in vector x.
@@ -22,18 +65,16 @@ class _DiscretePeaksBase:
         head: int
             Number of leading b's in x.
         """
+        if has_jit():
+            return _head_jit(_b, np.asarray(_x))
 
-        # Initialize counter
-        _head = 0
+        # The head ends at the first element that is not b
+        not_b = np.asarray(_x) != _b
 
-        # Iterate through values in vector
-        for i in _x:
-            if i == _b:
-                _head += 1
-            else:
-                break
+        if not not_b.any():
+            return len(not_b)
 
-        return _head
+        return int(np.argmax(not_b))
 
     @staticmethod
     def tail(_b, _x):
@@ -52,16 +93,8 @@ class _DiscretePeaksBase:
         tail: int
             Number of trailing b's in x.
         """
+        if has_jit():
+            return _tail_jit(_b, np.asarray(_x))
 
-        # Initialize counter
-        _tail = 0
-
-        # Iterate backwards through values in vector
-        for i in range(len(_x)):
-            if _x[len(_x) - i - 1] == _b:
-                _tail += 1
-            else:
-                break
-
-        return _tail
+        return _DiscretePeaksBase.head(_b, np.asarray(_x)[::-1])
 
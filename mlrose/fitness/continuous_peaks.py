@@ -5,8 +5,25 @@
 
 import numpy as np
 
+from mlrose.decorators import jit, has_jit
+from mlrose.fitness._discrete_peaks_base import _DiscretePeaksBase
+
+
+@jit
+def _max_run_jit(_b, _x):
+    _max = 0
+    run = 0
+    for i in range(len(_x)):
+        if _x[i] == _b:
+            run += 1
+            if run > _max:
+                _max = run
+        else:
+            run = 0
+    return _max
+
 
-class ContinuousPeaks:
+class ContinuousPeaks(_DiscretePeaksBase):
     """Fitness function for Continuous Peaks optimization problem. Evaluates
     the fitness of an n-dimensional state vector :math:`x`, given parameter T,
     as:
@@ -69,7 +86,7 @@ class ContinuousPeaks:
             Value of fitness function.
         """
         _n = len(state)
-        _t = np.ceil(self.t_pct*_n)
+        _t = self._get_threshold(_n)
 
         # Calculate length of maximum runs of 0's and 1's
         max_0 = self.max_run(0, state)
@@ -114,21 +131,15 @@ class ContinuousPeaks:
         max: int
             Length of maximum run of b's.
         """
-        # Initialize counter
-        _max = 0
-        run = 0
-
-        # Iterate through values in vector
-        for i in _x:
-            if i == _b:
-                run += 1
-            else:
-                if run > _max:
-                    _max = run
+        if has_jit():
+            return _max_run_jit(_b, np.asarray(_x))
 
-                run = 0
+        # Pad the match mask with zeros so that every run has both a start
+        # (+1 step) and an end (-1 step).
+        is_b = (np.asarray(_x) == _b).astype(np.int8)
+        steps = np.diff(np.concatenate(([0], is_b, [0])))
 
-        if (_x[-1] == _b) and (run > _max):
-            _max = run
+        starts = np.flatnonzero(steps == 1)
+        ends = np.flatnonzero(steps == -1)
 
-        return _max
+        return int((ends - starts).max(initial=0))
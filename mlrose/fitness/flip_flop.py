@@ -5,6 +5,17 @@
 
 import numpy as np
 
+from mlrose.decorators import jit, has_jit
+
+
+@jit
+def _count_flips_jit(state):
+    flips = 0
+    for i in range(1, len(state)):
+        if state[i] != state[i - 1]:
+            flips += 1
+    return flips
+
 
 class FlipFlop:
     """Fitness function for Flip Flop optimization problem. Evaluates the
@@ -48,20 +59,15 @@ class FlipFlop:
             Value of fitness function.
         """
 
-        fitness = sum([state[i] != state[i-1] for i in range(1, len(state))])
+        if has_jit():
+            return _count_flips_jit(np.asarray(state))
 
-
-        # may not be faster
-        """
-        runs = np.zeros(state.size-1, dtype=int)
-        np.not_equal(state[:-1], state[1:], out=runs)
-        fitness = np.sum(runs)
-        """
+        fitness = np.count_nonzero(np.diff(np.asarray(state)))
 
         return fitness
 
     def evaluate_many(self, states):
-        """Evaluate the fitness of a an ndarray of states.
+        """Evaluate the fitness of an ndarray of states.
 
         Parameters
         ----------
@@ -74,9 +80,7 @@ class FlipFlop:
             Population fitness values.
         """
 
-        runs = np.zeros((states.shape[0], states.shape[1]-1), dtype=int)
-        np.not_equal(states[:, :-1], states[:, 1:], out=runs)
-        fitness = np.sum(runs, axis=1)
+        fitness = np.count_nonzero(np.diff(states, axis=1), axis=1)
 
         return fitness
 
@@ -3,8 +3,6 @@
 # Author: Genevieve Hayes (Modified by Andrew Rollings)
 # License: BSD 3 clause
 
-import numpy as np
-
 from mlrose.fitness._discrete_peaks_base import _DiscretePeaksBase
 
 
@@ -76,7 +74,7 @@ class FourPeaks(_DiscretePeaksBase):
             Value of fitness function.
         """
         _n = len(state)
-        _t = np.ceil(self.t_pct*_n)
+        _t = self._get_threshold(_n)
 
         # Calculate head and tail values
         tail_0 = self.tail(0, state)
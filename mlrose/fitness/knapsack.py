@@ -46,7 +46,7 @@ class Knapsack:
         >>> fitness = mlrose.Knapsack(weights, values, max_weight_pct)
         >>> state = np.array([1, 0, 2, 1, 0])
         >>> fitness.evaluate(state)
-        11
+        11.0
 
     Note
     ----
@@ -56,9 +56,12 @@ class Knapsack:
 
     def __init__(self, weights, values, max_weight_pct=0.35, max_item_count=1, multiply_by_max_item_count=False):
 
-        self.weights = weights
-        self.values = values
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
         count_multiplier = max_item_count if multiply_by_max_item_count else 1.0
+        # Weights and values side by side, so that the total weight and
+        # total value of a batch of states come from a single matrix product
+        self._weights_values = np.column_stack([self.weights, self.values])
         self._w = np.ceil(np.sum(self.weights) * max_weight_pct * count_multiplier)
         self.prob_type = 'discrete'
 
@@ -98,8 +101,7 @@ class Knapsack:
                             + """ weight and values arrays.""")
 
         # Calculate total weight and value of knapsack
-        total_weight = np.sum(state*self.weights)
-        total_value = np.sum(state*self.values)
+        total_weight, total_value = np.dot(state, self._weights_values)
 
         # Allow for weight constraint
         if total_weight <= self._w:
@@ -109,6 +111,35 @@ class Knapsack:
 
         return fitness
 
+    def evaluate_many(self, states):
+        """Evaluate the fitness of an ndarray of states.
+
+        Parameters
+        ----------
+        states: ndarray
+            States array for evaluation, one state per row. Each row must be
+            the same length as the weights and values arrays.
+
+        Returns
+        -------
+        fitness: ndarray
+            Population fitness values.
+        """
+
+        if np.shape(states)[1] != len(self.weights):
+            raise Exception("""The state array must be the same size as the"""
+                            + """ weight and values arrays.""")
+
+        # Calculate total weight and value of every knapsack
+        totals = np.dot(states, self._weights_values)
+        total_weights = totals[:, 0]
+        total_values = totals[:, 1]
+
+        # Allow for weight constraint
+        fitness = np.where(total_weights <= self._w, total_values, 0)
+
+        return fitness
+
     def get_prob_type(self):
         """ Return the problem type.
 
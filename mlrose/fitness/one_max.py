@@ -53,6 +53,23 @@ class OneMax:
         fitness = np.sum(state)
         return fitness
 
+    def evaluate_many(self, states):
+        """Evaluate the fitness of an ndarray of states.
+
+        Parameters
+        ----------
+        states: ndarray
+            States array for evaluation, one state per row.
+
+        Returns
+        -------
+        fitness: ndarray
+            Population fitness values.
+        """
+
+        fitness = np.sum(states, axis=1)
+        return fitness
+
     def get_prob_type(self):
         """ Return the problem type.
 
@@ -4,7 +4,6 @@
 # License: BSD 3 clause
 
 import numpy as np
-import pandas as pd
 
 
 class TravellingSales:
@@ -99,9 +98,28 @@ class TravellingSales:
         self.dist_list = dist_list
         self.prob_type = 'tsp'
         if self.coords:
+            self._coords = np.array(self.coords, dtype=float)
             self.calculate_fitness = self.__calculate_fitness_by_coords
         else:
-            self.df_path_list = pd.DataFrame([[self.path_list[i][0], self.path_list[i][1], self.dist_list[i]] for i in range(len(self.path_list))])
+            # Dense lookup table of the distance between each pair of nodes,
+            # with np.inf where travel is not possible
+            node1_arr, node2_arr = np.array(self.path_list).T
+
+            # Nodes are used as indices, so whole-number floats are converted
+            if not np.issubdtype(node1_arr.dtype, np.integer):
+                if not (np.array_equal(node1_arr, np.round(node1_arr))
+                        and np.array_equal(node2_arr, np.round(node2_arr))):
+                    raise Exception("""All nodes must be integers.""")
+
+                node1_arr = node1_arr.astype(np.intp)
+                node2_arr = node2_arr.astype(np.intp)
+
+            num_nodes = max(np.max(node1_arr), np.max(node2_arr)) + 1
+
+            self._dist_matrix = np.full([num_nodes, num_nodes], np.inf)
+            self._dist_matrix[node1_arr, node2_arr] = self.dist_list
+            self._dist_matrix[node2_arr, node1_arr] = self.dist_list
+
             self.calculate_fitness = self.__calculate_fitness_by_distance
 
     def evaluate(self, state):
@@ -123,38 +141,56 @@ class TravellingSales:
         if self.is_coords and len(state) != len(self.coords):
             raise Exception("""state must have the same length as coords.""")
 
-        if not len(state) == len(set(state)):
+        state = np.asarray(state)
+
+        # Nodes are used as indices, so whole-number floats are converted
+        if not np.issubdtype(state.dtype, np.integer):
+            if not np.array_equal(state, np.round(state)):
+                raise Exception("""All elements of state must be"""
+                                + """ non-negative integers.""")
+
+            state = state.astype(np.intp)
+
+        min_node = state.min()
+        max_node = state.max()
+
+        # Within range, state is a tour only if every node is counted, so
+        # the count replaces building a set of the nodes
+        if min_node >= 0 and max_node < len(state):
+            is_tour = np.all(np.bincount(state, minlength=len(state)))
+        else:
+            is_tour = len(np.unique(state)) == len(state)
+
+        if not is_tour:
             raise Exception("""Each node must appear exactly once in state.""")
 
-        if min(state) < 0:
+        if min_node < 0:
             raise Exception("""All elements of state must be non-negative"""
                             + """ integers.""")
 
-        if max(state) >= len(state):
+        if max_node >= len(state):
             raise Exception("""All elements of state must be less than"""
                             + """ len(state).""")
 
         return self.calculate_fitness(state)
 
     def __calculate_fitness_by_coords(self, state):
-        # Calculate length of journey
-        ls = len(state)
-        nodes = np.array([self.coords[state[i]] for i in range(ls)] + [self.coords[state[0]]])
-        nodes.reshape((2, nodes.size // 2))
+        # Calculate length of journey, including the return leg
+        tour = np.append(state, state[0])
+        nodes = self._coords[tour]
         fitness = np.linalg.norm(nodes[1:] - nodes[:-1], axis=1).sum()
 
         return fitness
 
     def __calculate_fitness_by_distance(self, state):
+        # Look up the distance of every leg of the tour, including the return
+        # leg. Any impossible leg makes the total np.inf, including a leg to
+        # a node that has no distances at all.
+        if np.max(state) >= len(self._dist_matrix):
+            return np.inf
 
-        ls = len(state)
+        fitness = self._dist_matrix[state, np.roll(state, -1)].sum()
 
-        nodes = np.array([[state[i-1], state[i]] for i in range(1, ls)] + [[state[ls-1]] + [state[0]]])
-        nodes.sort(axis=1)
-        df_nodes = pd.merge(self.df_path_list, pd.DataFrame(nodes), how='inner')
-        if df_nodes.shape[0] != nodes.shape[0]:
-            return np.inf
-        fitness = df_nodes.iloc[:, 2].sum()
         return fitness
 
     def get_prob_type(self):
@@ -4,6 +4,7 @@
 # License: BSD 3 clause
 
 import numpy as np
+from joblib import Parallel, delayed
 
 
 class _OptProb:
@@ -20,6 +21,9 @@ class _OptProb:
         Set :code:`False` for minimization problem.
     """
 
+    # Smallest number of states worth the overhead of parallel evaluation
+    _min_parallel_states = 64
+
     def __init__(self, length, fitness_fn, maximize=True):
 
         if length < 0:
@@ -39,6 +43,8 @@ class _OptProb:
         self.population = []
         self.pop_fitness = []
         self.mate_probs = []
+        self._mate_cum_probs = []
+        self.n_jobs = 1
 
         if maximize:
             self.maximize = 1.0
@@ -65,11 +71,7 @@ class _OptProb:
         best: array
             State vector defining best neighbor.
         """
-        fitness_list = []
-
-        for neigh in self.neighbors:
-            fitness = self.eval_fitness(neigh)
-            fitness_list.append(fitness)
+        fitness_list = self.eval_fitness_many(self.neighbors)
 
         best = self.neighbors[np.argmax(fitness_list)]
 
@@ -95,6 +97,44 @@ class _OptProb:
 
         return fitness
 
+    def eval_fitness_many(self, states):
+        """Evaluate the fitness of several state vectors.
+
+        Fitness functions that provide an :code:`evaluate_many` method are
+        evaluated on all of the states in a single call.
+
+        Parameters
+        ----------
+        states: array
+            Numpy array containing one state vector per row.
+
+        Returns
+        -------
+        fitness: array
+            Numpy array containing the fitness of each state.
+        """
+        if hasattr(self.fitness_fn, 'evaluate_many'):
+            states = np.asarray(states)
+
+            if states.ndim == 2:
+                if states.shape[1] != self.length:
+                    raise Exception("state length must match problem length")
+
+                fitness = self.fitness_fn.evaluate_many(states)
+                return self.maximize*np.asarray(fitness)
+
+        if self.n_jobs != 1 and len(states) >= self._min_parallel_states:
+            if any(len(state) != self.length for state in states):
+                raise Exception("state length must match problem length")
+
+            fitness = Parallel(n_jobs=self.n_jobs)(
+                delayed(self.fitness_fn.evaluate)(state) for state in states)
+            return self.maximize*np.array(fitness)
+
+        fitness = [self.eval_fitness(state) for state in states]
+
+        return np.array(fitness)
+
     def eval_mate_probs(self):
         """
         Calculate the probability of each member of the population reproducing.
@@ -115,6 +155,8 @@ class _OptProb:
         else:
             self.mate_probs = pop_fitness/np.sum(pop_fitness)
 
+        self._mate_cum_probs = np.cumsum(self.mate_probs)
+
     def get_fitness(self):
         """ Return the fitness of the current state vector.
 
@@ -197,6 +239,56 @@ class _OptProb:
         """
         return self.state
 
+    def sample_mates(self, count):
+        """Select members of the population to reproduce, with probabilities
+        given by the current mate probabilities (roulette-wheel selection).
+
+        Parameters
+        ----------
+        count: int
+            Number of members to select.
+
+        Returns
+        -------
+        inds: array
+            Numpy array containing the population indices of the selected
+            members.
+        """
+        if len(self._mate_cum_probs) == 0:
+            raise Exception("""Mate probabilities must be calculated with"""
+                            + """ eval_mate_probs before sampling mates.""")
+
+        # A negative probability would leave the cumulative probabilities
+        # unsorted, and searchsorted would then silently select the wrong
+        # members.
+        if np.any(self.mate_probs < 0):
+            raise ValueError("""probabilities are not non-negative""")
+
+        # The first member whose cumulative probability exceeds each draw is
+        # selected, so members with zero probability are never selected.
+        draws = np.random.uniform(0, self._mate_cum_probs[-1], count)
+        inds = np.searchsorted(self._mate_cum_probs, draws, side='right')
+
+        return inds
+
+    def set_fitness_n_jobs(self, n_jobs):
+        """Set the number of jobs used to evaluate the fitness of populations
+        and neighborhoods.
+
+        The states are distributed over worker processes with joblib, so
+        the fitness function must be picklable. This only pays off for
+        expensive fitness functions: fitness functions that provide an
+        :code:`evaluate_many` method, and collections of fewer than 64
+        states, are always evaluated in the current process.
+
+        Parameters
+        ----------
+        n_jobs: int
+            Number of jobs, as accepted by :code:`joblib.Parallel`. 1 means
+            no parallelism; -1 means use all processors.
+        """
+        self.n_jobs = n_jobs
+
     def set_population(self, new_population):
         """ Change the current population to a specified new population and get
         the fitness of all members.
@@ -210,14 +302,9 @@ class _OptProb:
         self.evaluate_population_fitness()
 
     def evaluate_population_fitness(self):
-        # Calculate fitness
-        pop_fitness = []
-
-        for i in range(len(self.population)):
-            fitness = self.eval_fitness(self.population[i])
-            pop_fitness.append(fitness)
-
-        self.pop_fitness = np.array(pop_fitness)
+        """Calculate the fitness of every member of the current population.
+        """
+        self.pop_fitness = self.eval_fitness_many(self.population)
 
     def set_state(self, new_state):
         """
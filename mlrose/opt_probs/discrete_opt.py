@@ -4,15 +4,34 @@
 # License: BSD 3 clause
 
 import numpy as np
-from sklearn.metrics import mutual_info_score
 from scipy.sparse import csr_matrix
-from scipy.sparse.csgraph import minimum_spanning_tree, depth_first_tree
+from scipy.sparse.csgraph import minimum_spanning_tree, depth_first_order
 
 from mlrose.algorithms.crossovers import UniformCrossOver
 from mlrose.algorithms.mutators import SwapMutator
+from mlrose.decorators import jit, has_jit
 from mlrose.opt_probs._opt_prob import _OptProb
 
 
+@jit
+def _sample_nodes_jit(cum_probs, rand_sample, parent, sample_order,
+                      new_sample):
+    max_val = cum_probs.shape[2]
+
+    for s in range(new_sample.shape[0]):
+        for k in range(len(sample_order)):
+            i = sample_order[k]
+            par_val = new_sample[s, parent[i - 1]]
+
+            # First value whose cumulative probability exceeds the draw
+            val = 0
+            while (val < max_val - 1
+                   and cum_probs[i, par_val, val] <= rand_sample[s, i]):
+                val += 1
+
+            new_sample[s, i] = val
+
+
 class DiscreteOpt(_OptProb):
     """Class for defining discrete-state optimization problems.
 
@@ -58,6 +77,10 @@ class DiscreteOpt(_OptProb):
             self.max_val = max_val
 
         self.keep_sample = []
+        # Populations are handed to the fitness function, so they use the
+        # platform integer by default; see set_compact_population
+        self.pop_dtype = np.dtype(int)
+
         self.node_probs = np.zeros([self.length, self.max_val, self.max_val])
         self.parent_nodes = []
         self.sample_order = []
@@ -80,12 +103,11 @@ class DiscreteOpt(_OptProb):
         csr_mx = csr_matrix(mutual_info)
         mst = minimum_spanning_tree(csr_mx)
 
-        # Convert minimum spanning tree to depth first tree with node 0 as root
-        dft = depth_first_tree(csr_matrix(mst.toarray()), 0, directed=False)
-        dft = np.round(dft.toarray(), 10)
-
-        # Determine parent of each node
-        parent = np.argmin(dft[:, 1:], axis=0)
+        # Determine parent of each node by traversing the tree from node 0.
+        # Nodes the tree does not reach are attached to node 0.
+        _, predecessors = depth_first_order(mst, 0, directed=False,
+                                            return_predecessors=True)
+        parent = np.maximum(predecessors[1:], 0)
 
         # Get probs
         probs = np.zeros([self.length, self.max_val, self.max_val])
@@ -94,29 +116,31 @@ class DiscreteOpt(_OptProb):
                                    np.arange(self.max_val + 1),
                                    density=True)[0]
 
-        for i in range(1, self.length):
-            for j in range(self.max_val):
-                subset = self.keep_sample[np.where(
-                    self.keep_sample[:, parent[i - 1]] == j)[0]]
-
-                if not len(subset):
-                    probs[i, j] = 1 / self.max_val
-                else:
-                    temp_probs = np.histogram(subset[:, i],
-                                              np.arange(self.max_val + 1),
-                                              density=True)[0]
-
-                    # Check if noise argument is not default (in epsilon)
-                    if self.noise > 0:
-                        # Add noise, from the mimic argument "noise"
-                        temp_probs = (temp_probs + self.noise)
-                        # All probability adds up to one
-                        temp_probs = np.divide(temp_probs, np.sum(temp_probs))
-                        # Handle floating point error to ensure probability adds up to 1
-                        if sum(temp_probs) != 1.0:
-                            temp_probs = np.divide(temp_probs, np.sum(temp_probs))
-                    # Set probability
-                    probs[i, j] = temp_probs
+        # Count each (parent value, child value) pair for every node at once
+        parent_vals = self.keep_sample[:, parent].astype(int)
+        child_vals = self.keep_sample[:, 1:].astype(int)
+        nodes = np.arange(self.length - 1)
+
+        pair_inds = (nodes * self.max_val + parent_vals) * self.max_val + child_vals
+        counts = np.bincount(pair_inds.ravel(),
+                             minlength=(self.length - 1) * self.max_val ** 2)
+        counts = counts.reshape([self.length - 1, self.max_val, self.max_val])
+
+        # Normalize counts to conditional probabilities. Parent values that
+        # never occur in the sample get a uniform distribution.
+        totals = np.sum(counts, axis=2, keepdims=True)
+        cond_probs = np.divide(counts, totals,
+                               out=np.full(counts.shape, 1 / self.max_val),
+                               where=totals > 0)
+
+        # Check if noise argument is not default (in epsilon)
+        if self.noise > 0:
+            # Add noise, from the mimic argument "noise", and make sure all
+            # probabilities add up to one
+            cond_probs = cond_probs + self.noise
+            cond_probs /= np.sum(cond_probs, axis=2, keepdims=True)
+
+        probs[1:] = cond_probs
 
         # Update probs and parent
         self.node_probs = probs
@@ -139,13 +163,74 @@ class DiscreteOpt(_OptProb):
             self._get_mutual_info_impl = self._get_mutual_info_slow
             self._mut_inf = None
 
+    def set_compact_population(self, compact):
+        """Set whether random states, populations and MIMIC samples are
+        stored in the smallest signed integer type that holds every state
+        value (int8 for bit strings), rather than the platform integer.
+
+        This cuts the memory streamed by each population-wide fitness
+        evaluation, but the fitness function then receives these narrow
+        arrays, and any integer arithmetic it does on them can overflow.
+
+        Parameters
+        ----------
+        compact: bool
+            Whether to use the compact integer type.
+        """
+        if compact:
+            self.pop_dtype = np.min_scalar_type(-self.max_val)
+        else:
+            self.pop_dtype = np.dtype(int)
+
     def _get_mutual_info_slow(self):
-        mutual_info = np.zeros([self.length, self.length])
-        for i in range(self.length - 1):
-            for j in range(i + 1, self.length):
-                mutual_info[i, j] = -1 * mutual_info_score(
-                    self.keep_sample[:, i],
-                    self.keep_sample[:, j])
+        len_sample_kept = self.keep_sample.shape[0]
+
+        # Relabel the sample values as 0, ..., n_vals - 1
+        vals, labels = np.unique(self.keep_sample, return_inverse=True)
+        labels = labels.reshape(self.keep_sample.shape)
+        n_vals = len(vals)
+
+        # One-hot encode the (node, value) pairs of each sample. The Gram
+        # matrix of the encoding holds the contingency tables of all pairs of
+        # nodes, and its column sums hold the marginal counts.
+        rows = np.repeat(np.arange(len_sample_kept), self.length)
+        cols = (np.arange(self.length) * n_vals + labels).ravel()
+        one_hot = csr_matrix((np.ones(len(cols)), (rows, cols)),
+                             shape=(len_sample_kept, self.length * n_vals))
+
+        joint = (one_hot.T @ one_hot).tocoo()
+        marginal = np.asarray(one_hot.sum(axis=0)).ravel()
+
+        # Only the upper triangle of the mutual info matrix is needed
+        node_i = joint.row // n_vals
+        node_j = joint.col // n_vals
+        upper = node_i < node_j
+
+        counts = joint.data[upper]
+        row_counts = marginal[joint.row[upper]]
+        col_counts = marginal[joint.col[upper]]
+
+        # Mirror sklearn's mutual_info_score term by term, so that near-ties
+        # between node pairs resolve as they did when it was called per pair
+        joint_probs = counts / len_sample_kept
+        log_outer = (-np.log(row_counts * col_counts)
+                     + np.log(len_sample_kept) + np.log(len_sample_kept))
+        terms = (joint_probs * (np.log(counts) - np.log(len_sample_kept))
+                 + joint_probs * log_outer)
+        terms[np.abs(terms) < np.finfo(terms.dtype).eps] = 0
+
+        mutual_info = np.bincount(node_i[upper] * self.length + node_j[upper],
+                                  weights=terms,
+                                  minlength=self.length * self.length)
+        mutual_info = -1 * np.maximum(mutual_info, 0)
+        mutual_info = mutual_info.reshape([self.length, self.length])
+
+        # Nodes that take a single value share no information with any other
+        constant = np.sum(marginal.reshape([self.length, n_vals]) > 0,
+                          axis=1) == 1
+        mutual_info[constant, :] = 0
+        mutual_info[:, constant] = 0
+
         return mutual_info
 
     # adapted from https://github.com/parkds/mlrose/blob/f7154a1d3e3fdcd934bb3c683b943264d2870fd1/mlrose/algorithms.py
@@ -216,45 +301,51 @@ class DiscreteOpt(_OptProb):
     def find_neighbors(self):
         """Find all neighbors of the current state.
         """
-        self.neighbors = []
+        state = np.asarray(self.state)
+        inds = np.arange(self.length)
 
         if self.max_val == 2:
-            for i in range(self.length):
-                neighbor = np.copy(self.state)
-                neighbor[i] = np.abs(neighbor[i] - 1)
-                self.neighbors.append(neighbor)
+            # Row i of the neighbor matrix is the state with bit i flipped
+            neighbors = np.tile(state, (self.length, 1))
+            neighbors[inds, inds] = np.abs(state - 1)
 
         else:
-            for i in range(self.length):
-                vals = list(np.arange(self.max_val))
-                vals.remove(self.state[i])
+            # Each element takes every value other than its current one,
+            # in ascending order.
+            offsets = np.arange(1, self.max_val)
+            vals = np.sort((state[:, np.newaxis] + offsets) % self.max_val,
+                           axis=1)
 
-                for j in vals:
-                    neighbor = np.copy(self.state)
-                    neighbor[i] = j
-                    self.neighbors.append(neighbor)
+            neighbors = np.tile(state, (self.length * (self.max_val - 1), 1))
+            neighbors[np.arange(len(neighbors)),
+                      np.repeat(inds, self.max_val - 1)] = vals.ravel()
+
+        self.neighbors = neighbors
 
     def find_sample_order(self):
         """Determine order in which to generate sample vector elements.
         """
+        parent = np.array(self.parent_nodes, dtype=int)
+
+        # Group the children of each node once, in index order (node i + 1
+        # is a child of parent[i]).
+        by_parent = np.argsort(parent, kind='stable')
+        bounds = np.searchsorted(parent[by_parent], np.arange(self.length + 1))
+        children = np.split(by_parent + 1, bounds[1:-1])
+
         sample_order = []
-        last = [0]
-        parent = np.array(self.parent_nodes)
+        remaining = np.ones(self.length, dtype=bool)
+        last = np.array([0])
 
         while len(sample_order) < self.length:
-            inds = []
-
             # If last nodes list is empty, select random node than has not
             # previously been selected
             if len(last) == 0:
-                inds = [np.random.choice(list(set(np.arange(self.length)) -
-                                              set(sample_order)))]
-            else:
-                for i in last:
-                    inds += list(np.where(parent == i)[0] + 1)
+                last = np.array([np.random.choice(np.flatnonzero(remaining))])
 
-            sample_order += last
-            last = inds
+            sample_order += list(last)
+            remaining[last] = False
+            last = np.concatenate([children[i] for i in last])
 
         self.sample_order = sample_order
 
@@ -307,7 +398,8 @@ class DiscreteOpt(_OptProb):
         state: array
             Randomly generated state vector.
         """
-        state = np.random.randint(0, self.max_val, self.length)
+        state = np.random.randint(0, self.max_val, self.length,
+                                  dtype=self.pop_dtype)
 
         return state
 
@@ -326,9 +418,11 @@ class DiscreteOpt(_OptProb):
             neighbor[i] = np.abs(neighbor[i] - 1)
 
         else:
-            vals = list(np.arange(self.max_val))
-            vals.remove(neighbor[i])
-            neighbor[i] = vals[np.random.randint(0, self.max_val - 1)]
+            # Shift to one of the other max_val - 1 values, uniformly. The
+            # sum is taken as a Python int, so a narrow state dtype cannot
+            # wrap around before the modulo.
+            shift = np.random.randint(1, self.max_val)
+            neighbor[i] = (int(neighbor[i]) + shift) % self.max_val
 
         return neighbor
 
@@ -348,17 +442,23 @@ class DiscreteOpt(_OptProb):
             else:
                 raise Exception("""pop_size must be a positive integer.""")
 
-        population = []
-        pop_fitness = []
+        self.set_population(self._random_states(pop_size))
 
-        for _ in range(pop_size):
-            state = self.random()
-            population.append(state)
-            fitness = self.eval_fitness(state)
-            pop_fitness.append(fitness)
+    def _random_states(self, count):
+        """Return a matrix of random state vectors, one per row.
 
-        self.population = np.array(population)
-        self.pop_fitness = np.array(pop_fitness)
+        Parameters
+        ----------
+        count: int
+            Number of state vectors to generate.
+
+        Returns
+        -------
+        states: array
+            Numpy array of shape (count, length).
+        """
+        return np.random.randint(0, self.max_val, size=(count, self.length),
+                                 dtype=self.pop_dtype)
 
     def reproduce(self, parent_1, parent_2, mutation_prob=0.1):
         """Create child state vector from two parent state vectors.
@@ -420,24 +520,35 @@ class DiscreteOpt(_OptProb):
                 raise Exception("""sample_size must be a positive integer.""")
 
         # Initialize new sample matrix
-        new_sample = np.zeros([sample_size, self.length])
+        new_sample = np.zeros([sample_size, self.length], dtype=self.pop_dtype)
+
+        # Each element is sampled by inverting the cumulative distribution of
+        # its node, conditional on the value of its parent. The last
+        # cumulative probability can fall just short of 1, hence the clip.
+        cum_probs = np.cumsum(self.node_probs, axis=2)
+        rand_sample = np.random.uniform(size=[sample_size, self.length])
 
         # Get value of first element in new samples
-        new_sample[:, 0] = np.random.choice(self.max_val, sample_size,
-                                            p=self.node_probs[0, 0])
+        new_sample[:, 0] = np.minimum(
+            np.sum(cum_probs[0, 0] <= rand_sample[:, [0]], axis=1),
+            self.max_val - 1)
 
         # Get sample order
         self.find_sample_order()
         sample_order = self.sample_order[1:]
 
         # Get values for remaining elements in new samples
-        for i in sample_order:
-            par_ind = self.parent_nodes[i - 1]
+        if has_jit():
+            _sample_nodes_jit(cum_probs, rand_sample,
+                              np.asarray(self.parent_nodes, dtype=np.intp),
+                              np.asarray(sample_order, dtype=np.intp),
+                              new_sample)
+            return new_sample
 
-            for j in range(self.max_val):
-                inds = np.where(new_sample[:, par_ind] == j)[0]
-                new_sample[inds, i] = np.random.choice(self.max_val,
-                                                       len(inds),
-                                                       p=self.node_probs[i, j])
+        for i in sample_order:
+            par_vals = new_sample[:, self.parent_nodes[i - 1]]
+            new_sample[:, i] = np.minimum(
+                np.sum(cum_probs[i, par_vals] <= rand_sample[:, [i]], axis=1),
+                self.max_val - 1)
 
         return new_sample
@@ -104,10 +104,30 @@ class TSPOpt(DiscreteOpt):
         state: array
             Randomly generated state vector.
         """
-        state = np.random.permutation(self.length)
+        state = np.random.permutation(self.length).astype(self.pop_dtype,
+                                                         copy=False)
 
         return state
 
+    def _random_states(self, count):
+        """Return a matrix of random tours, one per row.
+
+        Parameters
+        ----------
+        count: int
+            Number of tours to generate.
+
+        Returns
+        -------
+        states: array
+            Numpy array of shape (count, length), where each row is a
+            permutation of the nodes.
+        """
+        # Sorting a row of uniform noise gives a uniformly random permutation
+        tours = np.argsort(np.random.rand(count, self.length), axis=1)
+
+        return tours.astype(self.pop_dtype)
+
     def random_mimic(self):
         """Generate single MIMIC sample from probability density.
 
@@ -117,7 +137,7 @@ class TSPOpt(DiscreteOpt):
             State vector of MIMIC random sample.
         """
         remaining = list(np.arange(self.length))
-        state = np.zeros(self.length, dtype=np.int8)
+        state = np.zeros(self.length, dtype=self.pop_dtype)
         sample_order = self.sample_order[1:]
         node_probs = np.copy(self.node_probs)
 
@@ -10,6 +10,7 @@ except:
     sys.path.append("..")
 
 import unittest
+from unittest import mock
 import numpy as np
 from mlrose import (OneMax, FlipFlop, FourPeaks, SixPeaks, ContinuousPeaks,
                     Knapsack, TravellingSales, Queens, MaxKColor,
@@ -29,12 +30,43 @@ class TestFitness(unittest.TestCase):
         state = np.array([0, 1, 0, 1, 1, 1, 1])
         assert OneMax().evaluate(state) == 5
 
+    @staticmethod
+    def test_onemax_many():
+        """Test OneMax fitness function for a population of states"""
+        states = np.array([[0, 1, 0, 1, 1, 1, 1],
+                           [0, 0, 0, 0, 0, 0, 0]])
+        assert np.array_equal(OneMax().evaluate_many(states), [5, 0])
+
     @staticmethod
     def test_flipflop():
         """Test FlipFlop fitness function"""
         state = np.array([0, 1, 0, 1, 1, 1, 1])
         assert FlipFlop().evaluate(state) == 3
 
+    @staticmethod
+    def test_flipflop_many():
+        """Test FlipFlop fitness function for a population of states"""
+        states = np.array([[0, 1, 0, 1, 1, 1, 1],
+                           [1, 1, 1, 1, 1, 1, 1],
+                           [0, 1, 0, 1, 0, 1, 0]])
+        assert np.array_equal(FlipFlop().evaluate_many(states), [3, 0, 6])
+
+    @staticmethod
+    def test_flipflop_no_jit():
+        """Test FlipFlop fitness function gives the same results with and
+        without numba"""
+        states = [np.array([0, 1, 0, 1, 1, 1, 1]),
+                  np.array([1, 1, 1, 1, 1, 1, 1]),
+                  np.array([0, 1, 0, 1, 0, 1, 0]),
+                  np.array([1])]
+        fitnesses = [3, 0, 6, 0]
+
+        for state, fitness in zip(states, fitnesses):
+            assert FlipFlop().evaluate(state) == fitness
+
+            with mock.patch('mlrose.decorators.jit_decorator.numba', None):
+                assert FlipFlop().evaluate(state) == fitness
+
     @staticmethod
     def test_head():
         """Test head function"""
@@ -68,6 +100,41 @@ class TestFitness(unittest.TestCase):
         state = np.array([1, 1, 1, 1, 0, 1, 0, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1])
         assert ContinuousPeaks.max_run(1, state) == 9
 
+    @staticmethod
+    def test_head_tail_no_jit():
+        """Test head and tail functions give the same results with and
+        without numba"""
+        states = [np.array([1, 1, 1, 1, 0, 1, 0, 2, 1, 1, 1, 1, 1, 4, 6, 1, 1]),
+                  np.array([1, 1, 1, 1, 1]),
+                  np.array([0, 2, 0, 2, 0]),
+                  np.array([1])]
+        heads = [4, 5, 0, 1]
+        tails = [2, 5, 0, 1]
+
+        for state, head, tail in zip(states, heads, tails):
+            assert (_DiscretePeaksBase.head(1, state) == head
+                    and _DiscretePeaksBase.tail(1, state) == tail)
+
+            with mock.patch('mlrose.decorators.jit_decorator.numba', None):
+                assert (_DiscretePeaksBase.head(1, state) == head
+                        and _DiscretePeaksBase.tail(1, state) == tail)
+
+    @staticmethod
+    def test_max_run_no_jit():
+        """Test max_run function gives the same results with and without
+        numba"""
+        states = [np.array([1, 1, 1, 1, 0, 1, 0, 2, 1, 1, 1, 1, 1, 4, 6, 1, 1]),
+                  np.array([1, 1, 1, 1, 0, 1, 0, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+                  np.array([1, 1, 1, 1, 1]),
+                  np.array([0, 2, 0, 2, 0])]
+        max_runs = [5, 9, 5, 0]
+
+        for state, max_run in zip(states, max_runs):
+            assert ContinuousPeaks.max_run(1, state) == max_run
+
+            with mock.patch('mlrose.decorators.jit_decorator.numba', None):
+                assert ContinuousPeaks.max_run(1, state) == max_run
+
     @staticmethod
     def test_fourpeaks_r0():
         """Test FourPeaks fitness function for the case where R=0 and max>0"""
@@ -80,6 +147,15 @@ class TestFitness(unittest.TestCase):
         state = np.array([1, 1, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0])
         assert FourPeaks(t_pct=0.15).evaluate(state) == 16
 
+    @staticmethod
+    def test_fourpeaks_t_pct_changed():
+        """Test FourPeaks fitness function after t_pct is changed"""
+        state = np.array([1, 1, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0])
+        fitness = FourPeaks(t_pct=0.15)
+        fitness.evaluate(state)
+        fitness.t_pct = 0.30
+        assert fitness.evaluate(state) == 4
+
     @staticmethod
     def test_fourpeaks_r0_max0():
         """Test FourPeaks fitness function for the case where R=0 and max=0"""
@@ -146,6 +222,20 @@ class TestFitness(unittest.TestCase):
         state = np.array([1, 0, 2, 1, 0])
         assert Knapsack(weights, values, max_weight_pct).evaluate(state) == 0
 
+    @staticmethod
+    def test_knapsack_many():
+        """Test Knapsack fitness function for a population of states, with
+        total weights both above and below the maximum"""
+        weights = [10, 5, 2, 8, 15]
+        values = [1, 2, 3, 4, 5]
+        max_weight_pct = 0.6
+
+        states = np.array([[1, 0, 2, 1, 0],
+                           [1, 1, 1, 1, 1],
+                           [0, 0, 0, 0, 0]])
+        fitness = Knapsack(weights, values, max_weight_pct).evaluate_many(states)
+        assert np.array_equal(fitness, [11, 0, 0])
+
     @staticmethod
     def test_travelling_sales_coords():
         """Test TravellingSales fitness function for case where city nodes
@@ -181,6 +271,51 @@ class TestFitness(unittest.TestCase):
 
         assert TravellingSales(distances=dists).evaluate(state) == np.inf
 
+    @staticmethod
+    def test_travelling_sales_float_state():
+        """Test TravellingSales fitness function for a tour given as whole
+        number floats"""
+
+        dists = [(0, 1, 3), (0, 2, 5), (0, 3, 1), (0, 4, 7), (1, 3, 6),
+                 (4, 1, 9), (2, 3, 8), (2, 4, 2), (3, 2, 8), (3, 4, 4)]
+
+        state = np.array([0., 1., 4., 3., 2.])
+
+        assert TravellingSales(distances=dists).evaluate(state) == 29
+
+    def test_travelling_sales_fractional_state(self):
+        """Test TravellingSales fitness function raises an error for a tour
+        containing fractional nodes"""
+
+        dists = [(0, 1, 3), (0, 2, 5), (1, 2, 6)]
+
+        state = np.array([0., 1.5, 2.])
+
+        with self.assertRaises(Exception):
+            TravellingSales(distances=dists).evaluate(state)
+
+    @staticmethod
+    def test_travelling_sales_float_dists():
+        """Test TravellingSales fitness function for distances given as a
+        float array"""
+
+        dists = np.array([[0, 1, 3.], [0, 2, 5], [1, 2, 6]])
+
+        state = np.array([0, 1, 2])
+
+        assert TravellingSales(distances=dists).evaluate(state) == 14
+
+    @staticmethod
+    def test_travelling_sales_unknown_node():
+        """Test TravellingSales fitness function for tour containing a node
+        that has no distances"""
+
+        dists = [(0, 1, 3), (0, 2, 5), (1, 2, 6)]
+
+        state = np.array([0, 1, 2, 3])
+
+        assert TravellingSales(distances=dists).evaluate(state) == np.inf
+
     @staticmethod
     def test_queens():
         """Test Queens fitness function"""
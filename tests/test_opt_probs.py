@@ -9,9 +9,12 @@ except:
     sys.path.append("..")
 
 import unittest
+from unittest import mock
 import numpy as np
+from joblib import Parallel
 
-from mlrose import OneMax, DiscreteOpt, ContinuousOpt, TSPOpt, OnePointCrossOver
+from mlrose import (OneMax, FlipFlop, CustomFitness, DiscreteOpt,
+                    ContinuousOpt, TSPOpt, OnePointCrossOver)
 
 # The following functions/classes are not automatically imported at
 # initialization, so must be imported explicitly from neural.py,
@@ -92,6 +95,62 @@ class TestOptProb(unittest.TestCase):
         assert (np.array_equal(problem.get_population(), pop)
                 and np.array_equal(problem.get_pop_fitness(), pop_fit))
 
+    @staticmethod
+    def test_set_population_evaluate_many():
+        """Test set_population method for a fitness function that evaluates
+        the whole population at once"""
+
+        problem = OptProb(5, FlipFlop(), maximize=False)
+
+        pop = np.array([[0, 0, 0, 0, 1],
+                        [1, 0, 1, 0, 1],
+                        [1, 1, 1, 1, 0],
+                        [0, 0, 0, 0, 0]])
+
+        pop_fit = -1.0*np.array([1, 4, 1, 0])
+
+        problem.set_population(pop)
+
+        assert (np.array_equal(problem.get_population(), pop)
+                and np.array_equal(problem.get_pop_fitness(), pop_fit))
+
+    @staticmethod
+    def test_set_population_parallel():
+        """Test set_population method when fitness is evaluated in parallel"""
+
+        problem = OptProb(5, CustomFitness(np.sum), maximize=False)
+        problem.set_fitness_n_jobs(2)
+
+        pop = np.random.randint(0, 5, size=(100, 5))
+
+        with mock.patch('mlrose.opt_probs._opt_prob.Parallel',
+                        wraps=Parallel) as parallel:
+            problem.set_population(pop)
+
+        parallel.assert_called_once_with(n_jobs=2)
+        assert np.array_equal(problem.get_pop_fitness(), -1.0*np.sum(pop, axis=1))
+
+    @staticmethod
+    def test_set_population_serial():
+        """Test set_population method evaluates fitness serially for a single
+        job or a small population"""
+
+        small_pop = np.random.randint(0, 5, size=(
+            OptProb._min_parallel_states - 1, 5))
+        large_pop = np.random.randint(0, 5, size=(100, 5))
+
+        for n_jobs, pop in [(1, large_pop), (2, small_pop)]:
+            problem = OptProb(5, CustomFitness(np.sum), maximize=False)
+            problem.set_fitness_n_jobs(n_jobs)
+
+            with mock.patch('mlrose.opt_probs._opt_prob.Parallel',
+                            wraps=Parallel) as parallel:
+                problem.set_population(pop)
+
+            parallel.assert_not_called()
+            assert np.array_equal(problem.get_pop_fitness(),
+                                  -1.0*np.sum(pop, axis=1))
+
     @staticmethod
     def test_best_child_max():
         """Test best_child method for a maximization problem"""
@@ -250,6 +309,52 @@ class TestOptProb(unittest.TestCase):
 
         assert np.allclose(problem.get_mate_probs(), probs, atol=0.00001)
 
+    @staticmethod
+    def test_sample_mates():
+        """Test sample_mates method never selects states with zero mate
+        probability"""
+
+        problem = OptProb(5, OneMax(), maximize=True)
+        pop = np.array([[0, 0, 0, 0, 0],
+                        [1, 0, 1, 0, 1],
+                        [0, 0, 0, 0, 0],
+                        [1, 1, 1, 1, 0],
+                        [0, 0, 0, 0, 0]])
+
+        problem.set_population(pop)
+        problem.eval_mate_probs()
+        mates = problem.sample_mates(1000)
+
+        assert (len(mates) == 1000
+                and set(np.unique(mates)) == {1, 3})
+
+    def test_sample_mates_before_eval(self):
+        """Test sample_mates method raises an error when mate probabilities
+        have not been calculated"""
+
+        problem = OptProb(5, OneMax(), maximize=True)
+        problem.set_population(np.array([[0, 0, 0, 0, 0],
+                                         [1, 0, 1, 0, 1]]))
+
+        with self.assertRaisesRegex(Exception, 'eval_mate_probs'):
+            problem.sample_mates(10)
+
+    def test_sample_mates_negative_fitness(self):
+        """Test sample_mates method raises an error when a maximization
+        problem has negative fitness values"""
+
+        problem = OptProb(5, CustomFitness(lambda state: state.sum() - 4),
+                          maximize=True)
+        pop = np.array([[0, 0, 0, 0, 0],
+                        [1, 0, 1, 0, 1],
+                        [1, 1, 1, 1, 1]])
+
+        problem.set_population(pop)
+        problem.eval_mate_probs()
+
+        with self.assertRaises(ValueError):
+            problem.sample_mates(10)
+
 
 class TestDiscreteOpt(unittest.TestCase):
     """Tests for DiscreteOpt class."""
@@ -425,6 +530,27 @@ class TestDiscreteOpt(unittest.TestCase):
 
         assert (len(neigh) == 5 and sum_diff == 1)
 
+    @staticmethod
+    def test_random_neighbor_max_gt2_int8():
+        """Test random_neighbor method does not wrap around for an int8
+        state when max_val is large"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True, max_val=100)
+
+        x = np.full(5, 99, dtype=np.int8)
+        problem.set_state(x)
+
+        new_vals = set()
+
+        for _ in range(5000):
+            neigh = problem.random_neighbor()
+            changed = neigh[neigh != x]
+
+            assert len(changed) == 1
+            new_vals.add(int(changed[0]))
+
+        assert new_vals == set(range(99))
+
     @staticmethod
     def test_random_pop():
         """Test random_pop method"""
@@ -439,6 +565,36 @@ class TestDiscreteOpt(unittest.TestCase):
                 and np.sum(pop) > 0 and np.sum(pop) < 500
                 and len(pop_fitness) == 100)
 
+    @staticmethod
+    def test_random_pop_integer_fitness():
+        """Test random_pop method passes states to the fitness function in a
+        type that integer arithmetic does not overflow"""
+
+        fitness = CustomFitness(lambda state: float(np.sum(state*50)))
+        problem = DiscreteOpt(10, fitness, maximize=True, max_val=5)
+        problem.random_pop(100)
+
+        pop = problem.get_population()
+        pop_fitness = problem.get_pop_fitness()
+
+        assert (pop.dtype == problem.random().dtype
+                and np.array_equal(pop_fitness,
+                                   50.0*np.sum(pop.astype(float), axis=1)))
+
+    @staticmethod
+    def test_random_pop_compact():
+        """Test random_pop method when compact populations are enabled"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True, max_val=5)
+        problem.set_compact_population(True)
+        problem.random_pop(100)
+
+        pop = problem.get_population()
+
+        assert (pop.dtype == np.int8 and problem.random().dtype == np.int8
+                and np.array_equal(problem.get_pop_fitness(),
+                                   np.sum(pop, axis=1)))
+
     @staticmethod
     def test_reproduce_mut0():
         """Test reproduce method when mutation_prob is 0"""
@@ -501,6 +657,36 @@ class TestDiscreteOpt(unittest.TestCase):
         assert (np.shape(sample)[0] == 100 and np.shape(sample)[1] == 5
                 and np.sum(sample) > 0 and np.sum(sample) < 500)
 
+    @staticmethod
+    def test_sample_pop_no_jit():
+        """Test sample_pop method gives the same sample with and without
+        numba"""
+
+        problem = DiscreteOpt(6, OneMax(), maximize=True, max_val=3)
+
+        pop = np.array([[0, 0, 0, 0, 1, 2],
+                        [1, 0, 2, 0, 1, 1],
+                        [1, 1, 1, 2, 0, 0],
+                        [2, 0, 0, 0, 1, 2],
+                        [0, 0, 0, 1, 0, 0],
+                        [1, 2, 1, 1, 1, 1]])
+
+        problem.keep_sample = pop
+        problem.noise = 0.1
+        problem.eval_node_probs()
+
+        seed = np.random.randint(2**31)
+
+        np.random.seed(seed)
+        sample = problem.sample_pop(100)
+
+        with mock.patch('mlrose.decorators.jit_decorator.numba', None):
+            np.random.seed(seed)
+            sample_no_jit = problem.sample_pop(100)
+
+        assert (np.shape(sample) == (100, 6)
+                and np.array_equal(sample, sample_no_jit))
+
 
 class TestContinuousOpt(unittest.TestCase):
     """Tests for ContinuousOpt class."""